@@ -1,17 +1,14 @@
 import os
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load .env file
-load_dotenv()
-
-import pymysql
-pymysql.install_as_MySQLdb()
-pymysql.version_info = (2, 2, 1, 'final', 0)
+from dotenv import dotenv_values
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-APP_PROFILE = os.environ.get('APP_PROFILE', 'local')
+# .env는 한 번만 파싱 (load_dotenv처럼 os.environ을 오염시키지 않음)
+_DOTENV = {k: v for k, v in dotenv_values().items() if v is not None}
+
+# 프로필 자체도 .env에만 있을 수 있으므로 환경변수 → .env 순으로 해석
+APP_PROFILE = os.environ.get('APP_PROFILE') or _DOTENV.get('APP_PROFILE', 'local')
 
 _PROFILE_DEFAULTS = {
     'local': {
@@ -36,6 +33,7 @@ _PROFILE_DEFAULTS = {
     'prod': {
         'DEBUG': 'False',
         'ALLOWED_HOSTS': '',
+        'DJANGO_MAX_CONN_AGE': '600',
         'DB_USER': 'root',
         'DB_PASSWORD': '',
         'BACK_HOST': 'boterview-app',
@@ -45,16 +43,20 @@ _PROFILE_DEFAULTS = {
 
 _profile = _PROFILE_DEFAULTS.get(APP_PROFILE, {})
 
+# 우선순위: os.environ > .env > 프로필 기본값
+_ENV = {**_profile, **_DOTENV, **os.environ}
+
 
 def _env(key, fallback=''):
-    return os.environ.get(key, _profile.get(key, fallback))
+    return _ENV.get(key, fallback)
 
 
 SECRET_KEY = _env('SECRET_KEY', 'django-insecure-gz^kh-ts6!a_m8c(il#79!0uf81a3rnr2v=eeh)!38s51-!o9_')
 
 DEBUG = _env('DEBUG', 'True') == 'True'
 
-ALLOWED_HOSTS = [h for h in _env('ALLOWED_HOSTS').split(',') if h]
+_allowed_hosts = _env('ALLOWED_HOSTS')
+ALLOWED_HOSTS = [h for h in _allowed_hosts.split(',') if h] if _allowed_hosts else []
 
 
 # Application definition
@@ -112,6 +114,9 @@ DATABASES = {
         'PASSWORD': _env('DB_PASSWORD'),
         'HOST': _env('DB_HOST', 'localhost'),
         'PORT': _env('DB_PORT', '3306'),
+        # 요청마다 연결을 새로 맺지 않도록 커넥션 재사용
+        'CONN_MAX_AGE': int(_env('DJANGO_MAX_CONN_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -167,3 +172,8 @@ AWS_S3_REGION_NAME = _env('AWS_S3_REGION_NAME', 'ap-northeast-2')
 GEMINI_API_KEY = _env('GEMINI_API_KEY')
 OPENAI_API_KEY = _env('OPENAI_API_KEY')
 GOOGLE_TTS_API_KEY = _env('GOOGLE_TTS_API_KEY')
+
+# STT backend: 'openai'(기본, whisper-1 API) 또는 'local'(faster-whisper int8)
+STT_BACKEND = _env('STT_BACKEND', 'openai')
+STT_LOCAL_MODEL = _env('STT_LOCAL_MODEL', 'small')
+STT_LOCAL_DEVICE = _env('STT_LOCAL_DEVICE', 'auto')
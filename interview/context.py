@@ -1,6 +1,6 @@
 from typing import List
 
-from .models import InterviewSetting
+from .models import InterviewSetting, PreQuestion, SettingSkill
 
 """ 
     setting_id를 기반으로 DB 테이블의 데이터를 가져옴
@@ -12,17 +12,21 @@ class LLMContextService:
     @staticmethod
     def get_setting_context(setting_id: str) -> str:
 
-        queryset = InterviewSetting.objects.prefetch_related(
-            "settingskill_set__skill",
-            "prequestion_set",
-        )
-        setting: InterviewSetting = queryset.get(setting_id=setting_id)
+        # 프롬프트에 쓰는 컬럼만 values/values_list로 직접 조회 (모델 인스턴스 생성 생략)
+        setting: InterviewSetting = InterviewSetting.objects.only(
+            "setting_id", "question_count", "interviewer_style",
+            "interviewer_gender", "interviewer_appearance", "position", "resume_uri",
+        ).get(setting_id=setting_id)
 
-        skill_names: List[str] = []
-        for setting_skill in setting.settingskill_set.all():
-            skill_names.append(setting_skill.skill.skill)
+        skill_names: List[str] = list(
+            SettingSkill.objects.filter(setting_id=setting_id)
+            .values_list("skill__skill", flat=True)
+        )
 
-        pre_questions = list(setting.prequestion_set.all())
+        pre_questions = list(
+            PreQuestion.objects.filter(setting_id=setting_id)
+            .values_list("question", "answer")
+        )
 
         lines: List[str] = []
 
@@ -41,9 +45,9 @@ class LLMContextService:
         lines.append("")
 
         lines.append("[PreQuestion]")
-        for pre_question in pre_questions:
-            lines.append(f"Q: {pre_question.question}")
-            lines.append(f"A: {pre_question.answer}")
+        for question, answer in pre_questions:
+            lines.append(f"Q: {question}")
+            lines.append(f"A: {answer}")
             lines.append("")
 
         # 이력서/포트폴리오 PDF 텍스트 추출
@@ -1,9 +1,14 @@
 import json
+import asyncio
+import hashlib
 import logging
+import random
+import time
 import uuid
-from google import genai
-from google.genai import types as genai_types
+from collections import OrderedDict
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.db import close_old_connections
 from django.utils import timezone
 from .models import InterviewQuestion, InterviewScore, Interview
 
@@ -31,6 +36,83 @@ OVERALL_REVIEW_SCHEMA = {
     "required": ["overall_review", "scores"],
 }
 
+# 오프라인/배치 채점용: 문항별 피드백 + 종합 평가를 호출 한 번에 받는 스키마
+BATCH_EVAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "per_question": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "sequence": {"type": "integer"},
+                    "feedback": {"type": "string"},
+                },
+                "required": ["sequence", "feedback"],
+            },
+        },
+        "overall_review": {"type": "string"},
+        "scores": {
+            "type": "object",
+            "properties": {st: _SCORE_ITEM_SCHEMA for st in SCORE_TYPES},
+            "required": SCORE_TYPES,
+        },
+    },
+    "required": ["per_question", "overall_review", "scores"],
+}
+
+# 고정 프롬프트 머리말은 모듈 상수로 (인접 문자열 리터럴은 컴파일 시점에 결합됨)
+_PROMPT_HEADER = (
+    "You are an AI Interviewer Evaluator. Your task is to evaluate the candidate's answer.\n"
+    "The 'Question' provided is the context or the problem given to the candidate.\n"
+    "The 'Answer' is the candidate's response which you must evaluate.\n"
+    "Do NOT evaluate the quality of the question itself. Focus ONLY on the quality of the answer in response to the question.\n\n"
+    "1. Analyze the answer's content, clarity, and relevance.\n"
+    "2. Check for CONSISTENCY with previous answers (Context). Point out any contradictions.\n"
+    "IMPORTANT: You MUST provide the evaluation feedback entirely in Korean (한국어).\n\n"
+)
+
+# 동일 프롬프트 재평가(재제출·재시작·같은 프리셋 다수 응시) 시 API 호출 생략용 캐시.
+# 프롬프트가 같으면 평가도 재사용 가능하므로 SHA-256 정확 일치로 충분함.
+_RESPONSE_CACHE: OrderedDict[str, str] = OrderedDict()
+_RESPONSE_CACHE_MAX = 128
+
+
+def _cache_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode()).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    text = _RESPONSE_CACHE.get(key)
+    if text is not None:
+        _RESPONSE_CACHE.move_to_end(key)
+    return text
+
+
+def _cache_put(key: str, text: str) -> None:
+    _RESPONSE_CACHE[key] = text
+    if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+        _RESPONSE_CACHE.popitem(last=False)
+
+
+# Gemini 일시 장애(429/5xx)는 짧은 백오프 후 재시도하면 대부분 성공함.
+# 면접 1건의 종합 평가가 통째로 날아가는 것보다 몇 초 기다리는 쪽이 싸다.
+_MAX_API_ATTEMPTS = 3
+
+
+def _is_retryable(exc: Exception) -> bool:
+    # 429/5xx는 일시 장애 → 재시도. 400(InvalidArgument)류는 재시도해도 같은 결과.
+    from google.genai import errors as genai_errors
+    if isinstance(exc, genai_errors.APIError):
+        return exc.code in (429, 500, 502, 503, 504)
+    return isinstance(exc, (TimeoutError, ConnectionError))
+
+
+def _new_id() -> str:
+    # 스키마가 CHAR(36) 정규형 UUID를 쓰므로 hex(32자) 대신 str() 유지
+    return str(uuid.uuid4())
+
+
 logger = logging.getLogger(__name__)
 
 class InterviewEvaluator:
@@ -45,16 +127,44 @@ class InterviewEvaluator:
     def _initialize(self):
         api_key = getattr(settings, 'GEMINI_API_KEY', None)
         if api_key:
+            # Django 기동(AppConfig.ready → receivers) 시 grpc/protobuf 로드를 피하기 위해 지연 임포트
+            from google import genai
             self.client = genai.Client(api_key=api_key)
         else:
             logger.warning("[Evaluator] GEMINI_API_KEY not found. AI features will be disabled.")
             self.client = None
 
+    def _generate_with_retry(self, **kwargs):
+        for attempt in range(_MAX_API_ATTEMPTS):
+            try:
+                return self.client.models.generate_content(**kwargs)
+            except Exception as e:
+                if attempt == _MAX_API_ATTEMPTS - 1 or not _is_retryable(e):
+                    raise
+                delay = 2 ** attempt + random.random()
+                logger.warning(f"[Evaluator] Transient API error ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    async def _generate_with_retry_async(self, **kwargs):
+        for attempt in range(_MAX_API_ATTEMPTS):
+            try:
+                return await self.client.aio.models.generate_content(**kwargs)
+            except Exception as e:
+                if attempt == _MAX_API_ATTEMPTS - 1 or not _is_retryable(e):
+                    raise
+                delay = 2 ** attempt + random.random()
+                logger.warning(f"[Evaluator] Transient API error ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
     def evaluate(self, interview_id: str, sequence: int, question: str, answer: str, history: list = []):
         """
         Evaluates the answer using Gemini, considering the context of previous Q&A.
-        history: snapshot of InterviewSession.history at the time of answer submission (thread-safe copy).
+        history: snapshot of InterviewSession.history (list of Turn) at the time of answer submission (thread-safe copy).
         """
+        asyncio.run(self.evaluate_async(interview_id, sequence, question, answer, history))
+
+    async def evaluate_async(self, interview_id: str, sequence: int, question: str, answer: str, history: list = []):
+        """evaluate의 비동기 본체. 이벤트 루프 위에서는 이쪽을 직접 await할 것."""
         if not self.client:
             logger.error("[Evaluator] Client not initialized. Skipping evaluation.")
             return
@@ -65,70 +175,69 @@ class InterviewEvaluator:
         # Construct prompt using prior Q&A context
         prompt = self._construct_prompt(prior_qa, question, answer)
 
-        evaluation = "평가 실패 (API Error)"
-        try:
-            response = self.client.models.generate_content(
-                model='gemini-2.5-flash',
-                contents=prompt
-            )
-            evaluation = response.text
-            logger.info(f"[Evaluator] Evaluation sequence {sequence} for {interview_id} completed.")
-
-        except Exception as e:
-            logger.error(f"[Evaluator] API Call failed: {e}")
-            evaluation = f"AI 평가를 불러올 수 없습니다. 원인: {str(e)}"
+        cache_key = _cache_key(prompt)
+        evaluation = _cache_get(cache_key)
+        if evaluation is None:
+            evaluation = "평가 실패 (API Error)"
+            try:
+                response = await self._generate_with_retry_async(
+                    model='gemini-2.5-flash',
+                    contents=prompt
+                )
+                evaluation = response.text
+                _cache_put(cache_key, evaluation)
+                logger.info(f"[Evaluator] Evaluation sequence {sequence} for {interview_id} completed.")
+
+            except Exception as e:
+                logger.error(f"[Evaluator] API Call failed: {e}")
+                evaluation = f"AI 평가를 불러올 수 없습니다. 원인: {str(e)}"
+        else:
+            logger.info(f"[Evaluator] Cache hit for sequence {sequence} of {interview_id}.")
 
         # Save to DB
-        self._save_to_db(interview_id, sequence, question, answer, evaluation)
+        # thread_sensitive=True(기본값)는 모든 쓰기를 asgiref의 단일 스레드로
+        # 직렬화하는 데다 그 스레드의 커넥션이 갱신되지 않음 → 워커 풀에서 실행
+        await sync_to_async(self._save_to_db, thread_sensitive=False)(
+            interview_id, sequence, question, answer, evaluation
+        )
 
     def _extract_prior_qa(self, history: list, current_question: str) -> list:
         """
         InterviewSession.history의 스냅샷에서 이전 Q&A 쌍을 추출.
-        현재 질문 직전까지의 (question, answer) 쌍을 리스트로 반환.
+        현재 질문 직전까지의 (question, answer) 튜플 리스트를 반환.
         """
         prior_qa = []
-        i = 0
-        while i < len(history) - 1:
-            entry = history[i]
-            next_entry = history[i + 1]
-            if entry.get("role") == "interviewer" and next_entry.get("role") == "user":
-                q_text = entry.get("text", "")
-                a_text = next_entry.get("text", "")
-                # 현재 평가 대상 질문은 제외
-                if q_text != current_question:
-                    prior_qa.append({"question": q_text, "answer": a_text})
-                i += 2
-            else:
-                i += 1
+        # zip으로 인접 쌍을 C 레벨에서 순회하고, 현재 질문에 닿으면 중단
+        for entry, next_entry in zip(history, history[1:]):
+            if entry.role == "interviewer" and next_entry.role == "user":
+                if entry.text == current_question:
+                    break
+                prior_qa.append((entry.text, next_entry.text))
         return prior_qa
 
     def _construct_prompt(self, prior_qa: list, current_question: str, current_answer: str) -> str:
-        prompt = "You are an AI Interviewer Evaluator. Your task is to evaluate the candidate's answer.\n"
-        prompt += "The 'Question' provided is the context or the problem given to the candidate.\n"
-        prompt += "The 'Answer' is the candidate's response which you must evaluate.\n"
-        prompt += "Do NOT evaluate the quality of the question itself. Focus ONLY on the quality of the answer in response to the question.\n\n"
-
-        prompt += "1. Analyze the answer's content, clarity, and relevance.\n"
-        prompt += "2. Check for CONSISTENCY with previous answers (Context). Point out any contradictions.\n"
-        prompt += "IMPORTANT: You MUST provide the evaluation feedback entirely in Korean (한국어).\n\n"
+        # += 누적은 매번 전체 문자열을 복사하므로 append + join으로 조립
+        parts = [_PROMPT_HEADER]
 
         if prior_qa:
-            prompt += "--- Previous Conversation (Context) ---\n"
-            for entry in prior_qa:
-                prompt += f"Q: {entry['question']}\nA: {entry['answer']}\n\n"
+            parts.append("--- Previous Conversation (Context) ---\n")
+            for q_text, a_text in prior_qa:
+                parts.append(f"Q: {q_text}\nA: {a_text}\n\n")
 
-        prompt += f"--- Current Question (Criteria) ---\n{current_question}\n\n"
-        prompt += f"--- Candidate's Answer (Target) ---\n{current_answer}\n\n"
-        prompt += "Evaluation (in Korean):"
-        return prompt
+        parts.append(f"--- Current Question (Criteria) ---\n{current_question}\n\n")
+        parts.append(f"--- Candidate's Answer (Target) ---\n{current_answer}\n\n")
+        parts.append("Evaluation (in Korean):")
+        return "".join(parts)
 
     def _save_to_db(self, interview_id, sequence, question, answer, evaluation):
+        # 유휴 시간이 MySQL wait_timeout을 넘긴 죽은 커넥션 정리
+        # (이 스레드는 요청 사이클 밖이라 시그널 기반 정리가 닿지 않음)
+        close_old_connections()
         try:
-            interview = Interview.objects.get(interview_id=interview_id)
-
+            # FK는 값만 있으면 되므로 Interview SELECT 없이 바로 INSERT
             InterviewQuestion.objects.create(
-                question_id=str(uuid.uuid4()),
-                interview=interview,
+                question_id=_new_id(),
+                interview_id=interview_id,
                 question=question,
                 answer=answer,
                 sequence=sequence,
@@ -139,8 +248,6 @@ class InterviewEvaluator:
 
             logger.info(f"[Evaluator] Saved result to DB for {interview_id}")
 
-        except Interview.DoesNotExist:
-            logger.error(f"[Evaluator] Interview {interview_id} not found.")
         except Exception as e:
             logger.error(f"[Evaluator] DB Save failed: {e}")
 
@@ -153,59 +260,150 @@ class InterviewEvaluator:
             logger.error("[Evaluator] Client not initialized. Skipping overall review.")
             return
 
-        try:
-            interview = Interview.objects.get(interview_id=interview_id)
-        except Interview.DoesNotExist:
-            logger.error(f"[Evaluator] Interview {interview_id} not found for overall review.")
-            return
-
-        questions = InterviewQuestion.objects.filter(interview=interview).order_by('created_at')
+        # 한 번에 필요한 컬럼만 가져와서 exists() 프로브 쿼리를 없앰
+        questions = list(
+            InterviewQuestion.objects.filter(interview_id=interview_id)
+            .order_by('created_at')
+            .values('question', 'answer', 'feedback')
+        )
 
-        if not questions.exists():
+        if not questions:
             logger.warning(f"[Evaluator] No questions for {interview_id}. Saving duration only.")
-            interview.duration = duration * 1000
-            interview.save(update_fields=['duration'])
+            if not Interview.objects.filter(interview_id=interview_id).update(duration=duration * 1000):
+                logger.error(f"[Evaluator] Interview {interview_id} not found for overall review.")
             return
 
         prompt = self._construct_overall_prompt(questions)
 
+        from google.genai import types as genai_types
+
         result = None
+        cache_key = _cache_key(prompt)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            result = json.loads(cached)
+        else:
+            try:
+                response = self._generate_with_retry(
+                    model='gemini-2.5-flash',
+                    contents=prompt,
+                    config=genai_types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=OVERALL_REVIEW_SCHEMA,
+                    ),
+                )
+                result = json.loads(response.text)
+                _cache_put(cache_key, response.text)
+                logger.info(f"[Evaluator] Overall review generated for {interview_id}")
+            except Exception as e:
+                logger.error(f"[Evaluator] Overall review API call failed: {e}")
+
         try:
-            response = self.client.models.generate_content(
+            # SELECT 후 save() 대신 UPDATE 한 번 (0행이면 인터뷰 없음)
+            updated = Interview.objects.filter(interview_id=interview_id).update(
+                duration=duration * 1000,  # 초 → 밀리초
+                ai_overall_review=(result or {}).get("overall_review", "AI 전체 평가를 생성하지 못했습니다."),
+            )
+            if not updated:
+                logger.error(f"[Evaluator] Interview {interview_id} not found for overall review.")
+                return
+
+            if result:
+                scores_data = result.get("scores", {})
+                InterviewScore.objects.bulk_create([
+                    InterviewScore(
+                        score_id=_new_id(),
+                        interview_id=interview_id,
+                        score_type=score_type,
+                        score=int(scores_data[score_type]["score"]),
+                        evaludation=scores_data[score_type].get("evaluation", ""),
+                    )
+                    for score_type in SCORE_TYPES
+                    if scores_data.get(score_type, {}).get("score") is not None
+                ])
+
+            logger.info(f"[Evaluator] Overall review & scores saved for {interview_id} (duration={duration}s)")
+        except Exception as e:
+            logger.error(f"[Evaluator] Overall review DB save failed: {e}")
+
+    def evaluate_batch(self, interview_id: str, qas: list[dict]) -> bool:
+        """N개 문항을 Gemini 호출 한 번으로 채점 (evaluate_backfill 커맨드용).
+
+        qas: [{"sequence": int, "question": str, "answer": str}, ...]
+        실시간 경로(evaluate_async)와 달리 HTTP 왕복을 1회로 줄이는 대신
+        응답 전체를 기다리므로 면접 종료 후 일괄 채점에만 쓴다.
+        성공 시 True 반환.
+        """
+        if not self.client:
+            logger.error("[Evaluator] Client not initialized. Skipping batch evaluation.")
+            return False
+
+        # 실시간 경로가 이미 저장한 면접에 다시 돌리면 문항이 통째로 중복됨
+        if InterviewQuestion.objects.filter(interview_id=interview_id).exists():
+            logger.error(f"[Evaluator] {interview_id} already has question rows. Refusing backfill.")
+            return False
+
+        prompt = (
+            "You are an AI Interviewer Evaluator. Below are all questions and answers "
+            "from one interview. For EACH question, evaluate the candidate's answer "
+            "(content, clarity, relevance, consistency across answers). Then produce an "
+            "overall review and the five scores. All text must be in Korean (한국어).\n\n"
+        )
+        prompt += "".join(
+            f"[문항 {qa['sequence']}]\n질문: {qa['question']}\n답변: {qa['answer'] or '(답변 없음)'}\n\n"
+            for qa in qas
+        )
+
+        from google.genai import types as genai_types
+
+        try:
+            response = self._generate_with_retry(
                 model='gemini-2.5-flash',
                 contents=prompt,
                 config=genai_types.GenerateContentConfig(
                     response_mime_type="application/json",
-                    response_schema=OVERALL_REVIEW_SCHEMA,
+                    response_schema=BATCH_EVAL_SCHEMA,
                 ),
             )
             result = json.loads(response.text)
-            logger.info(f"[Evaluator] Overall review generated for {interview_id}")
         except Exception as e:
-            logger.error(f"[Evaluator] Overall review API call failed: {e}")
-
-        try:
-            interview.duration = duration * 1000  # 초 → 밀리초
-            interview.ai_overall_review = (result or {}).get("overall_review", "AI 전체 평가를 생성하지 못했습니다.")
-            interview.save(update_fields=['duration', 'ai_overall_review'])
+            logger.error(f"[Evaluator] Batch evaluation API call failed: {e}")
+            return False
+
+        feedback_by_seq = {item["sequence"]: item["feedback"] for item in result.get("per_question", [])}
+        now = timezone.now()
+        InterviewQuestion.objects.bulk_create([
+            InterviewQuestion(
+                question_id=_new_id(),
+                interview_id=interview_id,
+                question=qa["question"],
+                answer=qa["answer"],
+                sequence=qa["sequence"],
+                elapsed_time=0,
+                feedback=feedback_by_seq.get(qa["sequence"], ""),
+                created_at=now,
+            )
+            for qa in qas
+        ])
 
-            if result:
-                scores_data = result.get("scores", {})
-                for score_type in SCORE_TYPES:
-                    score_item = scores_data.get(score_type, {})
-                    score_val = score_item.get("score")
-                    if score_val is not None:
-                        InterviewScore.objects.create(
-                            score_id=str(uuid.uuid4()),
-                            interview=interview,
-                            score_type=score_type,
-                            score=int(score_val),
-                            evaludation=score_item.get("evaluation", ""),
-                        )
+        Interview.objects.filter(interview_id=interview_id).update(
+            ai_overall_review=result.get("overall_review", "")
+        )
 
-            logger.info(f"[Evaluator] Overall review & scores saved for {interview_id} (duration={duration}s)")
-        except Exception as e:
-            logger.error(f"[Evaluator] Overall review DB save failed: {e}")
+        scores_data = result.get("scores", {})
+        InterviewScore.objects.bulk_create([
+            InterviewScore(
+                score_id=_new_id(),
+                interview_id=interview_id,
+                score_type=score_type,
+                score=int(scores_data[score_type]["score"]),
+                evaludation=scores_data[score_type].get("evaluation", ""),
+            )
+            for score_type in SCORE_TYPES
+            if scores_data.get(score_type, {}).get("score") is not None
+        ])
+        logger.info(f"[Evaluator] Batch evaluation saved for {interview_id} ({len(qas)} questions)")
+        return True
 
     def _construct_overall_prompt(self, questions) -> str:
         prompt = (
@@ -225,10 +423,10 @@ class InterviewEvaluator:
             "--- Interview Record ---\n\n"
         )
 
-        for idx, q in enumerate(questions, start=1):
-            prompt += f"[{idx}번 문항]\n"
-            prompt += f"질문: {q.question}\n"
-            prompt += f"답변: {q.answer or '(답변 없음)'}\n"
-            prompt += f"개별 피드백: {q.feedback or '(피드백 없음)'}\n\n"
-
-        return prompt
+        return prompt + "".join(
+            f"[{idx}번 문항]\n"
+            f"질문: {q['question']}\n"
+            f"답변: {q['answer'] or '(답변 없음)'}\n"
+            f"개별 피드백: {q['feedback'] or '(피드백 없음)'}\n\n"
+            for idx, q in enumerate(questions, start=1)
+        )
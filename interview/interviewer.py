@@ -1,8 +1,7 @@
 import json
 import asyncio
+from functools import lru_cache
 from typing import List, Dict
-from google import genai
-from google.genai import types
 from django.conf import settings
 from asgiref.sync import sync_to_async
 
@@ -11,28 +10,42 @@ from interview.context import LLMContextService
 from interview.schemas import LLM_RESPONSE_JSON_SCHEMA
 
 
+class Turn:
+    """면접 히스토리 한 항목. dict 대비 객체 크기가 작고 속성 접근이 빠르다."""
+
+    __slots__ = ("role", "text")
+
+    def __init__(self, role: str, text: str) -> None:
+        self.role = role
+        self.text = text
+
+
 class GeminiClient:
-    _client: genai.Client | None = None
+    _client = None  # genai.Client — 지연 임포트 때문에 타입 표기 생략
 
     @classmethod
-    def _get_client(cls) -> genai.Client:
+    def _get_client(cls):
         if cls._client is None:
+            # grpc/protobuf 로드를 첫 호출 시점으로 미룸 (Django 기동 경량화)
+            from google import genai
             cls._client = genai.Client(api_key=settings.GEMINI_API_KEY)
         return cls._client
 
     @staticmethod
-    def _build_contents(messages: List[Dict[str, str]]) -> List[types.Content]:
+    def _build_contents(messages: List[Turn]) -> list:
+        from google.genai import types
         contents = []
         for msg in messages:
-            role = "user" if msg["role"] == "user" else "model"
-            contents.append(types.Content(role=role, parts=[types.Part(text=msg["text"])]))
+            role = "user" if msg.role == "user" else "model"
+            contents.append(types.Content(role=role, parts=[types.Part(text=msg.text)]))
         return contents
 
     @classmethod
-    def _call_gemini_json_sync(cls, system_prompt: str, messages: List[Dict[str, str]]) -> Dict:
+    async def _call_gemini_json(cls, system_prompt: str, messages: List[Turn]) -> Dict:
+        from google.genai import types
         client = cls._get_client()
         contents = cls._build_contents(messages)
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.5-flash",
             contents=contents,
             config=types.GenerateContentConfig(
@@ -44,13 +57,40 @@ class GeminiClient:
         return json.loads(response.text)
 
 
-async def call_gemini_json(system_prompt: str, messages: List[Dict[str, str]]) -> Dict:
-    loop = asyncio.get_event_loop()
-    
-    def sync_call():
-        return GeminiClient._call_gemini_json_sync(system_prompt, messages)
-    
-    return await loop.run_in_executor(None, sync_call)
+async def call_gemini_json(system_prompt: str, messages: List[Turn]) -> Dict:
+    # 네이티브 async 클라이언트 사용: 기본 스레드풀을 점유하지 않고
+    # 내부 커넥션 풀(keep-alive)을 재사용함
+    return await GeminiClient._call_gemini_json(system_prompt, messages)
+
+
+@lru_cache(maxsize=256)
+def _build_system_prompt_cached(persona: str, question_count: int, max_questions: int,
+                                followup_remaining: int, setting_context: str) -> str:
+    """턴마다 페르소나 파일 재로딩·문자열 재조립을 피하기 위한 메모이즈."""
+    persona_text = PersonaService.get_persona(persona)
+    return (
+        f"{persona_text}\n\n"
+        "면접 진행 규칙:\n"
+        "- 한 번에 하나의 질문만 합니다.\n"
+        "- 질문은 간결하게 1~3문장으로 합니다.\n"
+        f"- 현재 {question_count}/{max_questions}번째 질문입니다.\n"
+        f"- 현재 질문에 대한 꼬리질문 가능 횟수: {followup_remaining}회\n"
+        "- 꼬리질문 규칙:\n"
+        "  - 지원자의 답변이 모호하거나 구체성이 부족하면 is_followup=true로 꼬리질문을 합니다.\n"
+        "  - 꼬리질문 가능 횟수가 0이면 반드시 is_followup=false로 새 주제 질문을 합니다.\n"
+        "  - 답변이 충분히 구체적이면 is_followup=false로 새 주제 질문을 합니다.\n\n"
+        "[면접 설정 정보 (아래 내용을 참고해서 질문을 생성해)]\n"
+        f"{setting_context}"
+    )
+
+
+# 답변 길이 버킷별 분석 힌트 (상수 테이블 — 턴마다 리스트/조인 생성 안 함)
+_SHORT_ANSWER_MAX = 20
+_LONG_ANSWER_MIN = 500
+_LENGTH_HINTS = {
+    "short": "지원자의 답변이 매우 짧습니다. 더 구체적으로 답변하도록 유도해 주세요.",
+    "long": "지원자의 답변이 길었습니다. 핵심을 요약하도록 유도할 수 있습니다.",
+}
 
 
 class InterviewSession:
@@ -62,7 +102,7 @@ class InterviewSession:
         self.setting_id = setting_id
         self.question_count = 0
         self.followup_count = 0       # 현재 질문에 대한 꼬리질문 누적 횟수
-        self.history: List[Dict[str, str]] = []
+        self.history: List[Turn] = []
         self.finished = False
         self._setting_context: str = ""
 
@@ -70,31 +110,20 @@ class InterviewSession:
         self._setting_context = await sync_to_async(LLMContextService.get_setting_context)(self.setting_id)
 
     def add_question(self, text: str) -> None:
-        self.history.append({"role": "interviewer", "text": text})
+        self.history.append(Turn("interviewer", text))
         self.question_count += 1
 
     def add_answer(self, text: str) -> None:
-        self.history.append({"role": "user", "text": text})
+        self.history.append(Turn("user", text))
 
     def is_last_question(self) -> bool:
         return self.question_count >= self.max_questions
 
     def _build_system_prompt(self) -> str:
-        persona_text = PersonaService.get_persona(self.persona)
         followup_remaining = self.MAX_FOLLOWUPS_PER_QUESTION - self.followup_count
-        return (
-            f"{persona_text}\n\n"
-            "면접 진행 규칙:\n"
-            "- 한 번에 하나의 질문만 합니다.\n"
-            "- 질문은 간결하게 1~3문장으로 합니다.\n"
-            f"- 현재 {self.question_count}/{self.max_questions}번째 질문입니다.\n"
-            f"- 현재 질문에 대한 꼬리질문 가능 횟수: {followup_remaining}회\n"
-            "- 꼬리질문 규칙:\n"
-            "  - 지원자의 답변이 모호하거나 구체성이 부족하면 is_followup=true로 꼬리질문을 합니다.\n"
-            "  - 꼬리질문 가능 횟수가 0이면 반드시 is_followup=false로 새 주제 질문을 합니다.\n"
-            "  - 답변이 충분히 구체적이면 is_followup=false로 새 주제 질문을 합니다.\n\n"
-            "[면접 설정 정보 (아래 내용을 참고해서 질문을 생성해)]\n"
-            f"{self._setting_context}"
+        return _build_system_prompt_cached(
+            self.persona, self.question_count, self.max_questions,
+            followup_remaining, self._setting_context,
         )
 
     @staticmethod
@@ -107,8 +136,8 @@ class InterviewSession:
 
     async def generate_first_question(self) -> Dict:
         system_prompt = self._build_system_prompt()
-        messages: List[Dict[str, str]] = [
-            {"role": "user", "text": "첫 번째 면접 질문을 생성해주세요. 반드시 지원자에게 간단한 자기소개를 요청하는 것으로 시작하세요.\n\n현재 질문 순서: 1번째"}
+        messages: List[Turn] = [
+            Turn("user", "첫 번째 면접 질문을 생성해주세요. 반드시 지원자에게 간단한 자기소개를 요청하는 것으로 시작하세요.\n\n현재 질문 순서: 1번째")
         ]
         data = await call_gemini_json(system_prompt, messages)
         result = self._json_to_result(data, finished=False)
@@ -127,22 +156,14 @@ class InterviewSession:
         if self.is_last_question():
             return await self._generate_closing()
 
-        # 답변 길이 분석 힌트 생성
-        analysis_hints: List[str] = []
-        if len(user_text) < 20:
-            analysis_hints.append("지원자의 답변이 매우 짧습니다. 더 구체적으로 답변하도록 유도해 주세요.")
-        if len(user_text) > 500:
-            analysis_hints.append("지원자의 답변이 길었습니다. 핵심을 요약하도록 유도할 수 있습니다.")
+        # 답변 길이 버킷 판정 (일반적인 길이면 문자열 작업 없음)
+        text_len = len(user_text)
+        bucket = "short" if text_len < _SHORT_ANSWER_MAX else "long" if text_len > _LONG_ANSWER_MIN else ""
 
         # 시스템 프롬프트 구성
         system_prompt = self._build_system_prompt()
-        if analysis_hints:
-            system_prompt += "\n\n분석 참고:\n" + "\n".join(analysis_hints)
-
-        # 히스토리를 메시지 형식으로 변환
-        messages: List[Dict[str, str]] = []
-        for entry in self.history:
-            messages.append({"role": entry["role"], "text": entry["text"]})
+        if bucket:
+            system_prompt += "\n\n분석 참고:\n" + _LENGTH_HINTS[bucket]
 
         # 꼬리질문 가능 여부를 프롬프트에 명시
         if self._can_followup():
@@ -157,7 +178,8 @@ class InterviewSession:
                 f"현재 질문 순서: {self.question_count + 1}번째"
             )
 
-        messages.append({"role": "user", "text": next_instruction})
+        # history 항목을 재생성 없이 그대로 전달
+        messages: List[Turn] = [*self.history, Turn("user", next_instruction)]
 
         data = await call_gemini_json(system_prompt, messages)
 
@@ -169,7 +191,7 @@ class InterviewSession:
             # 꼬리질문: question_count도 증가, followup_count도 증가
             self.followup_count += 1
             # 꼬리질문 접두사 없이 자연스럽게 전달
-            self.history.append({"role": "interviewer", "text": result["text"]})
+            self.history.append(Turn("interviewer", result["text"]))
             self.question_count += 1
         else:
             # 새 주제 질문: question_count 증가, followup_count 리셋
@@ -179,17 +201,12 @@ class InterviewSession:
         return result
 
     async def _generate_closing(self) -> Dict:
-        # 히스토리를 메시지 형식으로 변환
-        messages: List[Dict[str, str]] = []
-        for entry in self.history:
-            messages.append({"role": entry["role"], "text": entry["text"]})
-        
-        # 마무리 요청 추가
-        messages.append({
-            "role": "user",
-            "text": "모든 질문이 끝났습니다. 면접을 마무리하는 인사를 해 주세요. 수고했다는 격려와 함께 짧게 마무리합니다. next_question에 마무리 멘트를 작성하고, 새로운 질문은 하지 마세요.",
-        })
-        
+        # 마무리 요청만 덧붙여 전달 (히스토리 dict 재생성 불필요)
+        messages: List[Turn] = [*self.history, Turn(
+            "user",
+            "모든 질문이 끝났습니다. 면접을 마무리하는 인사를 해 주세요. 수고했다는 격려와 함께 짧게 마무리합니다. next_question에 마무리 멘트를 작성하고, 새로운 질문은 하지 마세요.",
+        )]
+
         system_prompt = self._build_system_prompt()
         data = await call_gemini_json(system_prompt, messages)
         result = self._json_to_result(data, finished=True)
@@ -0,0 +1,37 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.evaluator import InterviewEvaluator
+from interview.models import Interview
+
+
+class Command(BaseCommand):
+    help = (
+        "실시간 채점이 유실된 면접의 Q&A를 Gemini 호출 한 번으로 백필 채점합니다. "
+        "입력 파일: [{\"sequence\": int, \"question\": str, \"answer\": str}, ...] JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("interview_id")
+        parser.add_argument("qa_file", help="Q&A JSON 파일 경로")
+
+    def handle(self, *args, **options):
+        interview_id = options["interview_id"]
+        if not Interview.objects.filter(interview_id=interview_id).exists():
+            raise CommandError(f"Interview {interview_id}가 존재하지 않습니다.")
+
+        try:
+            with open(options["qa_file"], encoding="utf-8") as f:
+                qas = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Q&A 파일을 읽을 수 없습니다: {e}")
+        if not isinstance(qas, list) or not qas:
+            raise CommandError("Q&A 파일은 비어 있지 않은 JSON 배열이어야 합니다.")
+
+        evaluator = InterviewEvaluator()
+        if not evaluator.evaluate_batch(interview_id, qas):
+            raise CommandError("배치 채점에 실패했습니다. 로그를 확인하세요.")
+        self.stdout.write(self.style.SUCCESS(
+            f"{interview_id}: {len(qas)}개 문항 백필 채점 완료"
+        ))
@@ -1,11 +1,17 @@
 import logging
 import uuid
 from datetime import datetime
+from django.db import connection, transaction
 from django.utils import timezone
-from interview.models import Interview, InterviewMaterial, InterviewScore, InterviewQuestion
 
 logger = logging.getLogger(__name__)
 
+
+def _new_id() -> str:
+    # 스키마가 CHAR(36) 정규형 UUID를 쓰므로 hex(32자) 대신 str() 유지
+    return str(uuid.uuid4())
+
+
 def save_interview_result(room_id: str, video_url: str, audio_url: str, duration: float) -> bool:
     """
     인터뷰 결과를 Django ORM을 사용하여 DB에 저장합니다.
@@ -18,58 +24,50 @@ def save_interview_result(room_id: str, video_url: str, audio_url: str, duration
     dummy_score = 80
 
     try:
-        # 1. Update Interview
-        updated_count = Interview.objects.filter(interview_id=room_id).update(
-            duration=int(duration),
-            ai_overall_review=dummy_summary
-        )
-
-        if updated_count == 0:
-            logger.warning(f"[DB] Interview not found for id {room_id}. Skipping details.")
-            return False
-
-        # Interview 인스턴스 가져오기
-        interview_instance = Interview.objects.get(interview_id=room_id)
+        # 모든 쓰기를 단일 커서·단일 트랜잭션으로 실행 (커밋 fsync 1회)
         now = timezone.now()
+        with transaction.atomic(), connection.cursor() as cursor:
+            # 1. Update Interview
+            cursor.execute(
+                "UPDATE interview SET duration = %s, ai_overall_review = %s "
+                "WHERE interview_id = %s",
+                [int(duration), dummy_summary, room_id],
+            )
 
-        # 2. Insert Video Material
-        InterviewMaterial.objects.create(
-            material_id=str(uuid.uuid4()),
-            interview=interview_instance,
-            material_type='VIDEO',
-            file_path=video_url,
-            created_at=now
-        )
+            if cursor.rowcount == 0:
+                logger.warning(f"[DB] Interview not found for id {room_id}. Skipping details.")
+                return False
 
-        # 2. Insert Audio Material
-        InterviewMaterial.objects.create(
-            material_id=str(uuid.uuid4()),
-            interview=interview_instance,
-            material_type='AUDIO',
-            file_path=audio_url,
-            created_at=now
-        )
+            # 2. Insert Video/Audio Material (multi-row INSERT 한 방)
+            cursor.execute(
+                "INSERT INTO interview_material "
+                "(material_id, interview_id, material_type, file_path, created_at) "
+                "VALUES (%s, %s, %s, %s, %s), (%s, %s, %s, %s, %s)",
+                [
+                    _new_id(), room_id, 'VIDEO', video_url, now,
+                    _new_id(), room_id, 'AUDIO', audio_url, now,
+                ],
+            )
 
-        # 3. Insert Score (evaludation typo check)
-        InterviewScore.objects.create(
-            score_id=str(uuid.uuid4()),
-            interview=interview_instance,
-            score_type='AI_EVAL',
-            score=dummy_score,
-            evaludation=dummy_evaluation
-        )
+            # 3. Insert Score (evaludation typo check)
+            cursor.execute(
+                "INSERT INTO interview_score "
+                "(score_id, interview_id, score_type, score, evaludation) "
+                "VALUES (%s, %s, %s, %s, %s)",
+                [_new_id(), room_id, 'AI_EVAL', dummy_score, dummy_evaluation],
+            )
 
-        # 4. Insert Question (Dummy STT)
-        InterviewQuestion.objects.create(
-            question_id=str(uuid.uuid4()),
-            interview=interview_instance,
-            question="AI 면접 질문 (전체)",
-            answer=dummy_stt,
-            created_at=now,
-            elapsed_time=int(duration)
-        )
+            # 4. Insert Question (Dummy STT)
+            cursor.execute(
+                "INSERT INTO interview_question "
+                "(question_id, interview_id, question, answer, sequence, "
+                " elapsed_time, feedback, created_at) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+                [_new_id(), room_id, "AI 면접 질문 (전체)", dummy_stt, 0,
+                 int(duration), '', now],
+            )
 
-        logger.info(f"[DB] Saved full result for interview {room_id} (ORM)")
+        logger.info(f"[DB] Saved full result for interview {room_id} (raw SQL)")
         return True
 
     except Exception as e:
@@ -1,39 +1,49 @@
-import json
+import orjson
 
-from django.http import JsonResponse
+from django.db import IntegrityError
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from .models import Interview, InterviewSetting
+from .models import Interview
 from django.utils import timezone
 
-from signaling.session import start as signaling_start
-from .serializers import NotifyRequestSerializer
-
 @csrf_exempt
 @require_http_methods(["POST"])
 def notify(request):
 
-    body = json.loads(request.body.decode('utf-8'))
-    serializer = NotifyRequestSerializer(data=body)
+    # 필드 하나뿐이라 DRF Serializer 기동 비용 없이 직접 검증
+    try:
+        body = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
+        return JsonResponse({"error": "잘못된 JSON 본문입니다."}, status=400)
+    if not isinstance(body, dict):
+        return JsonResponse({"error": "JSON 객체 본문이 필요합니다."}, status=400)
 
-    if not serializer.is_valid():
-        return JsonResponse(serializer.errors, status=400)
+    room_id = body.get("roomId")
+    if not isinstance(room_id, str) or not room_id or len(room_id) > 255:
+        return JsonResponse({"roomId": ["올바른 roomId가 필요합니다."]}, status=400)
 
-    room_id = serializer.validated_data["roomId"]
     setting_id = room_id
 
-    setting = InterviewSetting.objects.get(setting_id=setting_id)
-
-    from signaling.session import get_session, remove_session
+    # signaling 체인(websockets/aiortc/av)은 첫 요청 시점에만 로드
+    from signaling.session import start as signaling_start, get_session, remove_session
     if get_session(room_id) is not None:
         remove_session(room_id)
 
-    Interview.objects.get_or_create(
-        interview_id=room_id,
-        defaults={"setting": setting, "created_at": timezone.now()},
-    )
+    try:
+        # setting_id == room_id이므로 InterviewSetting SELECT 없이 FK 값만 기록
+        Interview.objects.get_or_create(
+            interview_id=room_id,
+            defaults={"setting_id": setting_id, "created_at": timezone.now()},
+        )
+    except IntegrityError:
+        return JsonResponse({"error": "존재하지 않는 setting_id 입니다."}, status=400)
 
     if signaling_start(room_id):
-        return JsonResponse({"status": "ok"})
+        return HttpResponse(orjson.dumps({"status": "ok"}), content_type="application/json")
 
-    return JsonResponse({"error": "서버 오류가 발생했습니다."}, status=500)
+    return HttpResponse(
+        orjson.dumps({"error": "서버 오류가 발생했습니다."}),
+        content_type="application/json",
+        status=500,
+    )
@@ -1,5 +1,9 @@
-import json
 import asyncio
+import logging
+
+import orjson
+
+logger = logging.getLogger(__name__)
 
 
 class DataChannelMixin:
@@ -8,11 +12,16 @@ class DataChannelMixin:
         self._dc = channel
         self._dc.on("message", self._on_dc_message)
         self._dc.on("close", self._on_dc_close)
-        asyncio.ensure_future(self._start_interview())
+        # 폴링 없이 open 상태를 기다릴 수 있도록 이벤트로 알림
+        if channel.readyState == "open":
+            self._dc_open.set()
+        else:
+            channel.on("open", self._dc_open.set)
+        self._loop.create_task(self._start_interview())
         self._start_interview_timer()
 
     def _on_dc_message(self, message) -> None:
-        data = json.loads(message)
+        data = orjson.loads(message)
         msg_type = data.get("type")
 
         if msg_type == "PTT_START":
@@ -22,16 +31,20 @@ class DataChannelMixin:
 
     def _on_dc_close(self) -> None:
         self._dc = None
+        self._dc_open.clear()
 
     def send_dc(self, data: dict) -> None:
-        if self._dc and self._dc.readyState == "open":
-            self._dc.send(json.dumps(data, ensure_ascii=False))
+        # 닫힌 채널이면 직렬화 전에 바로 반환 (직렬화 낭비 방지)
+        if not (self._dc and self._dc.readyState == "open"):
+            logger.warning("[DC] 채널이 열려있지 않아 전송 불가: %s", data.get("type"))
+            return
+        # orjson은 기본이 ensure_ascii=False 동작, dc.send는 str을 기대
+        self._dc.send(orjson.dumps(data).decode())
 
     async def send_dc_async(self, data: dict, timeout: float = 10.0) -> None:
-        elapsed = 0.0
-        while elapsed < timeout:
-            if self._dc and self._dc.readyState == "open":
-                self._dc.send(json.dumps(data, ensure_ascii=False))
-                return
-            await asyncio.sleep(0.1)
-            elapsed += 0.1
+        try:
+            await asyncio.wait_for(self._dc_open.wait(), timeout)
+        except asyncio.TimeoutError:
+            return
+        if self._dc and self._dc.readyState == "open":
+            self._dc.send(orjson.dumps(data).decode())
@@ -1,4 +1,5 @@
 import asyncio
+import re
 import time
 
 from asgiref.sync import sync_to_async
@@ -10,20 +11,25 @@ from interview.signals import answer_submitted, interview_ended
 INTERVIEW_MAX_DURATION = 30 * 60 # 30분
 PTT_NO_RESPONSE_TIMEOUT = 2 * 60 # 2분
 
+# 문장 경계(./?/!) 기준 분리 — TTS 합성·재생 파이프라인용
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.?!])\s+")
+
+
+def _split_sentences(text: str) -> list[str]:
+    return [s for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()] or [text]
+
 class InterviewMixin:
 
     # 각 인터뷰 시작 시 타이머 설정
     def _start_interview_timer(self) -> None:
-        loop = asyncio.get_event_loop()
-        self._interview_timer = loop.call_later(INTERVIEW_MAX_DURATION, self._on_interview_timeout)
+        self._interview_timer = self._loop.call_later(INTERVIEW_MAX_DURATION, self._on_interview_timeout)
 
     # PTT 타이머 재 설정
     def _reset_ptt_timeout(self) -> None:
         # webrtc.py에 있음
         if self._ptt_timeout_timer:
             self._ptt_timeout_timer.cancel()
-        loop = asyncio.get_event_loop()
-        self._ptt_timeout_timer = loop.call_later(PTT_NO_RESPONSE_TIMEOUT, self._on_ptt_timeout)
+        self._ptt_timeout_timer = self._loop.call_later(PTT_NO_RESPONSE_TIMEOUT, self._on_ptt_timeout)
 
     def _get_elapsed_seconds(self) -> int:
         """면접 시작부터 현재까지 경과한 시간을 초 단위로 반환."""
@@ -96,8 +102,8 @@ class InterviewMixin:
     async def _handle_interview_answer(self, user_text: str) -> None:
         last_question = ""
         last_entry = self._interview.history[-1]
-        if last_entry.get("role") == "interviewer":
-            last_question = last_entry.get("text", "")
+        if last_entry.role == "interviewer":
+            last_question = last_entry.text
 
         # history 스냅샷: 평가 스레드와의 race condition 방지를 위해 복사본 전달
         history_snapshot = list(self._interview.history)
@@ -122,7 +128,7 @@ class InterviewMixin:
                 self._ptt_timeout_timer.cancel()
                 self._ptt_timeout_timer = None
             # 클로징 TTS가 프론트에 전달될 시간 확보 후 세션 종료
-            asyncio.get_event_loop().call_later(1.0, self._deferred_remove_session)
+            self._loop.call_later(1.0, self._deferred_remove_session)
         else:
             self.send_dc({
                 "type": "AI_QUESTION",
@@ -138,9 +144,18 @@ class InterviewMixin:
         remove_session(self.room_id)
 
     async def _speak(self, text: str) -> None:
-        pcm_bytes = await tts_synthesize(text, gender=self._gender)
-        if self._recorder:
-            self._recorder.push_audio_pcm(pcm_bytes)
-        await self._tts_track.play(pcm_bytes)
+        # 문장 단위 파이프라인: 첫 문장 합성이 끝나면 바로 재생을 시작하고,
+        # 다음 문장은 현재 문장이 재생되는 동안 미리 합성해 둠
+        sentences = _split_sentences(text)
+        next_pcm = self._loop.create_task(tts_synthesize(sentences[0], gender=self._gender))
+        for i in range(len(sentences)):
+            pcm_bytes = await next_pcm
+            if i + 1 < len(sentences):
+                next_pcm = self._loop.create_task(
+                    tts_synthesize(sentences[i + 1], gender=self._gender)
+                )
+            if self._recorder:
+                self._recorder.push_audio_pcm(pcm_bytes)
+            await self._tts_track.play(pcm_bytes)
         self.send_dc({"type": "AI_DONE"})
         self._reset_ptt_timeout()
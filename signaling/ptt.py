@@ -1,66 +1,144 @@
-import io
-import wave
+import struct
 import asyncio
 
+import numpy as np
+
 from speech.stt import transcribe as stt_transcribe
 
 MAX_AUDIO_BUFFER_BYTES = 18 * 1024 * 1024
 PTT_MAX_RECORDING_DURATION = 3 * 60
 
+# 이 길이만큼 쌓이면 발화 중에도 해당 구간의 STT를 미리 시작함.
+# 실제 절단은 무음 프레임에서 이뤄지고, MAX는 쉼 없는 발화의 강제 절단 상한.
+STT_WINDOW_SECONDS = 10
+STT_WINDOW_MAX_SECONDS = 15
+
 
 class PTTMixin:
 
     def _start_recording(self) -> None:
         self._ptt_active = True
-        self._audio_frames.clear()
-        self._audio_buffer_size = 0
-        self._ptt_recording_start = asyncio.get_event_loop().time()
+        self._audio_pos = 0
+        self._stt_partials: list[asyncio.Future] = []
+        self._stt_dispatched_bytes = 0  # 이미 STT로 보낸 버퍼 오프셋
+        self._stt_speech_ranges = []
+        self._ptt_recording_start = self._loop.time()
+        # 프레임마다 뺄셈 대신 비교 한 번이면 되도록 마감 시각을 미리 계산
+        self._ptt_deadline = self._ptt_recording_start + PTT_MAX_RECORDING_DURATION
         if self._ptt_timeout_timer:
             self._ptt_timeout_timer.cancel()
             self._ptt_timeout_timer = None
 
+    def _mark_speech(self, start: int, end: int) -> None:
+        """VAD가 발화로 판정한 버퍼 구간을 기록 (인접 프레임은 하나로 병합)."""
+        ranges = self._stt_speech_ranges
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = end
+        else:
+            ranges.append([start, end])
+
+    def _maybe_dispatch_stt_window(self, is_silence: bool) -> None:
+        """발화 중 창 단위 선행 STT: 버퍼가 창 크기를 넘으면 그 구간을 먼저 전사.
+
+        고정 바이트 오프셋에서 자르면 단어 한가운데가 잘려 경계 단어가
+        유실되므로, 창이 찬 뒤 처음 만나는 무음 프레임에서 자른다. 쉼 없이
+        말이 이어지면 상한(STT_WINDOW_MAX_SECONDS)에서 강제로 자른다.
+        """
+        pending = self._audio_pos - self._stt_dispatched_bytes
+        bytes_per_second = self._audio_sample_rate * self._audio_channels * 2
+        if pending >= bytes_per_second * STT_WINDOW_SECONDS and (
+            is_silence or pending >= bytes_per_second * STT_WINDOW_MAX_SECONDS
+        ):
+            self._dispatch_stt_window()
+
+    def _dispatch_stt_window(self) -> None:
+        if self._audio_pos <= self._stt_dispatched_bytes:
+            return
+        ranges = self._stt_speech_ranges
+        self._stt_speech_ranges = []
+        self._stt_dispatched_bytes = self._audio_pos
+        if not ranges:
+            return  # 전 구간 무음 → 전사할 것 없음
+        # 무음 구간을 건너뛰고 발화 구간만 이어붙여 STT에 전달
+        mv = memoryview(self._audio_buf)
+        segment = b"".join(mv[start:end] for start, end in ranges)
+        wav_bytes = self._stt_wav(segment)
+        self._stt_partials.append(self._loop.create_task(stt_transcribe(wav_bytes)))
+
     def _stop_recording(self) -> None:
         self._ptt_active = False
-        if not self._audio_frames:
+        if self._audio_pos == 0:
             return
-        wav_bytes = self._frames_to_wav()
-        self._audio_frames.clear()
-        self._audio_buffer_size = 0
-        if self._recorder:
-            # WAV 헤더(44바이트) 제거 후 raw PCM 전달
-            self._recorder.push_audio_pcm(wav_bytes[44:], self._audio_sample_rate)
-        asyncio.ensure_future(self._process_stt(wav_bytes))
 
-    async def _process_stt(self, wav_bytes: bytes) -> None:
-        # WAV 헤더(44 bytes) 제외한 실제 PCM 데이터 길이로 최소 녹음 시간 확인
+        # 최소 녹음 시간 확인 (이미 창이 전사 중이면 길이는 충분함)
         # sample_rate * channels * bit_depth(2 bytes) * 최소 0.15초
         min_bytes = int(self._audio_sample_rate * self._audio_channels * 2 * 0.15)
-        pcm_size = len(wav_bytes) - 44  # WAV 헤더 크기
-        if pcm_size < min_bytes:
+        if self._audio_pos < min_bytes and not self._stt_partials:
+            self._audio_pos = 0
             self.send_dc({"type": "PTT_TOO_SHORT"})
             return
 
+        if self._recorder:
+            # raw PCM 전체를 녹화 파일에 전달
+            pcm_bytes = bytes(memoryview(self._audio_buf)[:self._audio_pos])
+            self._recorder.push_audio_pcm(pcm_bytes, self._audio_sample_rate)
+
+        # 남은 꼬리 구간 전사 시작 후 전체 병합
+        self._dispatch_stt_window()
+        partials = self._stt_partials
+        self._stt_partials = []
+        self._audio_pos = 0
+        self._loop.create_task(self._process_stt(partials))
+
+    async def _process_stt(self, partials: list[asyncio.Future]) -> None:
         try:
-            text = await stt_transcribe(wav_bytes)
+            texts = await asyncio.gather(*partials)
         except Exception as e:
             import logging
             logging.getLogger(__name__).warning(f"[PTT] STT failed: {e}")
             self.send_dc({"type": "PTT_TOO_SHORT"})
             return
 
+        text = " ".join(t.strip() for t in texts if t and t.strip())
         self.send_dc({"type": "USER_STT", "text": text})
         if self._interview and not self._interview.finished:
             await self._handle_interview_answer(text)
 
+    def _stt_wav(self, segment) -> bytes:
+        """STT 업로드용 WAV: 16kHz 모노로 줄여 페이로드를 1/3 이하로 만듦.
+
+        Whisper는 어차피 내부에서 16kHz 모노로 변환하므로 품질 손실 없이
+        업로드 크기와 다운스트림 리샘플 비용만 줄어든다.
+        정수배가 아닌 샘플레이트는 변환 없이 원본 그대로 보낸다.
+        """
+        sample_rate = self._audio_sample_rate
+        channels = self._audio_channels
+        pcm = np.frombuffer(segment, dtype=np.int16)
+        if channels > 1:
+            pcm = pcm[: len(pcm) // channels * channels].reshape(-1, channels).mean(axis=1)
+            channels = 1
+        if sample_rate % 16000 == 0 and sample_rate != 16000:
+            step = sample_rate // 16000
+            # 블록 평균 다운샘플 (평균이 간이 저역 필터 역할)
+            pcm = pcm[: len(pcm) // step * step].reshape(-1, step).mean(axis=1)
+            sample_rate = 16000
+        if pcm.dtype != np.int16:
+            pcm = pcm.astype(np.int16)
+        return self._pcm_to_wav(pcm.tobytes(), sample_rate, channels)
 
-    def _frames_to_wav(self) -> bytes:
-        buf = io.BytesIO()
-        with wave.open(buf, 'wb') as wf:
-            wf.setnchannels(self._audio_channels)
-            wf.setsampwidth(2)
-            wf.setframerate(self._audio_sample_rate)
-            for raw in self._audio_frames:
-                wf.writeframes(raw)
-        wav_bytes = buf.getvalue()
-        buf.close()
-        return wav_bytes
+    def _pcm_to_wav(self, data, sample_rate: int | None = None, channels: int | None = None) -> bytes:
+        # 샘플이 이미 16bit LE PCM이므로 wave 모듈의 프레임 단위 호출 대신
+        # 44바이트 RIFF 헤더를 직접 만들어 한 번에 이어붙임
+        if channels is None:
+            channels = self._audio_channels
+        if sample_rate is None:
+            sample_rate = self._audio_sample_rate
+        byte_rate = sample_rate * channels * 2
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + len(data), b"WAVE",
+            b"fmt ", 16, 1, channels, sample_rate, byte_rate, channels * 2, 16,
+            b"data", len(data),
+        )
+        # data가 memoryview여도 복사 1회로 합쳐짐
+        return b"".join((header, data))
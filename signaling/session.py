@@ -16,19 +16,39 @@ _sessions: dict[str, WebRTCSession] = {}
 _sessions_lock = threading.Lock()
 MAX_CONCURRENT_SESSIONS = 10
 
+# 세션마다 스레드+이벤트 루프를 만들지 않고 공유 루프 하나에서 전부 실행
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _new_loop() -> asyncio.AbstractEventLoop:
+    try:
+        # libuv 기반 루프: 프레임 50Hz × 세션 수의 recv/타이머 부하에 여유가 커짐
+        import uvloop
+        return uvloop.new_event_loop()
+    except ImportError:
+        return asyncio.new_event_loop()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = _new_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="signaling-loop", daemon=True
+            ).start()
+    return _loop
+
 
 def start(room_id: str) -> bool:
     with _sessions_lock:
         if len(_sessions) >= MAX_CONCURRENT_SESSIONS:
             return False
-    threading.Thread(target=_run_session, args=(room_id,), daemon=True).start()
+    asyncio.run_coroutine_threadsafe(_session(room_id), _get_loop())
     return True
 
 
-def _run_session(room_id: str) -> None:
-    asyncio.run(_session(room_id))
-
-
 async def _session(room_id: str) -> None:
     ws_url = f"ws://{BACK_HOST}:{BACK_PORT}/ws-native"
     session: WebRTCSession | None = None
@@ -90,4 +110,5 @@ def remove_session(room_id: str) -> None:
     with _sessions_lock:
         session = _sessions.pop(room_id, None)
     if session:
-        asyncio.ensure_future(session.cleanup())
+        # 루프 밖(Django 요청 스레드 등)에서 불려도 안전하게 스케줄
+        asyncio.run_coroutine_threadsafe(session.cleanup(), _get_loop())
@@ -1,21 +1,23 @@
-import json
 from typing import Any
 
-def frame(command: str, headers: dict[str, Any] | None = None, body: str = "") -> str:
-    lines = [command]
+import orjson
+
+def frame(command: str, headers: dict[str, Any] | None = None, body: bytes = b"") -> bytes:
+    # bytes 프레임을 바로 만들어 websocket 라이브러리의 UTF-8 인코딩 단계를 생략
+    lines = [command.encode()]
     for k, v in (headers or {}).items():
-        lines.append(f"{k}:{v}")
-    lines.append("")
+        lines.append(f"{k}:{v}".encode())
+    lines.append(b"")
     lines.append(body)
-    return "\n".join(lines) + "\x00"
+    return b"\n".join(lines) + b"\x00"
 
 async def send(ws, destination: str, data: dict) -> None:
-    body = json.dumps(data)
-    await ws.send(frame("SEND", {
-        "destination": destination,
-        "content-type": "application/json",
-        "content-length": len(body),
-    }, body))
+    # orjson(C 구현)은 바로 UTF-8 bytes를 돌려주므로 재인코딩 없이 프레임에 이어붙임
+    raw = orjson.dumps(data)
+    await ws.send(
+        f"SEND\ndestination:{destination}\ncontent-type:application/json\n"
+        f"content-length:{len(raw)}\n\n".encode() + raw + b"\x00"
+    )
 
 
 async def subscribe(ws, destination: str, sub_id: str) -> None:
@@ -30,7 +32,7 @@ def parse_body(msg: str) -> dict | None:
         body = msg.split("\n\n", 1)[1].rstrip("\x00")
         if body:
             try:
-                return json.loads(body)
-            except json.JSONDecodeError:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
                 pass
     return None
@@ -1,32 +1,85 @@
 import logging
 import asyncio
+import webrtcvad
 from aiortc import RTCPeerConnection, RTCSessionDescription, RTCIceCandidate
-from aiortc.mediastreams import MediaStreamTrack
+from aiortc.mediastreams import MediaStreamError, MediaStreamTrack
 from signaling import stomp
 from signaling.datachannel import DataChannelMixin
-from signaling.ptt import PTTMixin, MAX_AUDIO_BUFFER_BYTES, PTT_MAX_RECORDING_DURATION
+from signaling.ptt import PTTMixin, MAX_AUDIO_BUFFER_BYTES
 from signaling.interview_handler import InterviewMixin
 from speech.audio_track import TTSAudioTrack
 
 logger = logging.getLogger(__name__)
 
+# RTCPeerConnection 생성은 인증서(X.509) 생성 때문에 수십 ms가 걸림.
+# 미리 만들어 둔 것을 빌려 쓰고, 보충은 워커 스레드에서 수행해
+# 전 세션의 오디오를 페이싱하는 시그널링 루프를 막지 않음.
+_peer_pool: list[RTCPeerConnection] = []
+_PEER_POOL_SIZE = 2
+_pool_refilling = False
+
+
+def _schedule_refill(loop: asyncio.AbstractEventLoop) -> None:
+    global _pool_refilling
+    missing = _PEER_POOL_SIZE - len(_peer_pool)
+    if _pool_refilling or missing <= 0:
+        return
+    _pool_refilling = True
+    # 생성자는 순수 CPU 작업(인증서 생성)이고 루프에 닿지 않으므로 off-loop 안전.
+    # 리스너/트랙 연결은 루프 위의 WebRTCSession.__init__에서 이뤄짐.
+    future = loop.run_in_executor(
+        None, lambda: [RTCPeerConnection() for _ in range(missing)]
+    )
+
+    def _done(f) -> None:
+        global _pool_refilling
+        _pool_refilling = False
+        try:
+            _peer_pool.extend(f.result())
+        except Exception as e:
+            logger.warning("[Pool] RTCPeerConnection 보충 실패: %s", e)
+
+    future.add_done_callback(_done)
+
+
+def _lease_peer(loop: asyncio.AbstractEventLoop) -> RTCPeerConnection:
+    # 풀이 빈 콜드 스타트에서만 루프에서 직접 생성 (이후부터는 풀이 흡수)
+    peer = _peer_pool.pop() if _peer_pool else RTCPeerConnection()
+    _schedule_refill(loop)
+    return peer
+
 
 class WebRTCSession(DataChannelMixin, PTTMixin, InterviewMixin):
     def __init__(self, room_id: str, stomp_ws) -> None:
         self.room_id = room_id
         self.stomp_ws = stomp_ws
-        self.peer = RTCPeerConnection()
-        self.peer.on("track", lambda track: asyncio.ensure_future(self._on_track(track)))
+        # 핫 패스에서 asyncio.get_event_loop() 조회를 피하기 위해 캐시
+        self._loop = asyncio.get_running_loop()
+        self.peer = _lease_peer(self._loop)
+        # 트랙 소비는 전용 태스크로 돌고, cleanup에서 남아 있으면 취소함
+        self._track_tasks: set[asyncio.Task] = set()
+        self.peer.on("track", self._start_track_task)
         self.peer.on("connectionstatechange", self._on_connection_state_change)
         self.peer.on("datachannel", self._on_datachannel)
+        # 폴링 없이 ICE 수집 완료를 기다릴 수 있도록 이벤트로 알림
+        self._ice_gathered = asyncio.Event()
+        self.peer.on("icegatheringstatechange", self._on_ice_gathering_state_change)
 
         self._dc = None
+        self._dc_open = asyncio.Event()
 
         self._ptt_active = False
-        self._audio_frames: list[bytes] = []
-        self._audio_buffer_size = 0
+        # PTT 오디오는 사전 할당된 단일 버퍼에 기록 (프레임당 bytes 객체 생성 안 함)
+        self._audio_buf = bytearray(MAX_AUDIO_BUFFER_BYTES)
+        self._audio_pos = 0
         self._audio_sample_rate = 48000
         self._audio_channels = 1
+        self._stt_partials: list[asyncio.Future] = []
+        self._stt_dispatched_bytes = 0
+        # STT로 보낼 발화 구간 [시작, 끝) 바이트 범위 (인접 프레임은 병합됨)
+        self._stt_speech_ranges: list[list[int]] = []
+        # 무음 프레임을 STT에서 걸러 Whisper가 침묵 구간을 환청하는 것을 방지
+        self._vad = webrtcvad.Vad(2)
 
         self._interview = None
         self._tts_track = TTSAudioTrack()
@@ -39,16 +92,25 @@ class WebRTCSession(DataChannelMixin, PTTMixin, InterviewMixin):
         self._interview_timer: asyncio.TimerHandle | None = None
         self._ptt_timeout_timer: asyncio.TimerHandle | None = None
         self._ptt_recording_start: float = 0.0
+        self._ptt_deadline: float = 0.0
 
         self.closed = asyncio.Event()
 
+    def _start_track_task(self, track: MediaStreamTrack) -> None:
+        task = self._loop.create_task(self._on_track(track))
+        self._track_tasks.add(task)
+        task.add_done_callback(self._track_tasks.discard)
+
     async def _on_track(self, track: MediaStreamTrack) -> None:
         if track.kind == "video":
             while True:
                 try:
                     frame = await track.recv()
-                except Exception:
+                except MediaStreamError:
                     break
+                except Exception as e:
+                    logger.warning("[Track] 비디오 디코드 오류, 프레임 스킵: %s", e)
+                    continue
                 if self._recorder:
                     try:
                         self._recorder.push_video(frame)
@@ -58,31 +120,58 @@ class WebRTCSession(DataChannelMixin, PTTMixin, InterviewMixin):
 
         if track.kind != "audio":
             return
+        # 50Hz × 세션 수만큼 도는 핫 루프: 프레임마다 바뀌지 않는 것은 전부 지역 변수로
+        loop_time = self._loop.time
+        vad_is_speech = self._vad.is_speech
+        buf = self._audio_buf
+        max_bytes = MAX_AUDIO_BUFFER_BYTES
         while True:
             try:
                 frame = await track.recv()
-            except Exception as e:
-                logger.debug("Track ended: %s", e)
+            except MediaStreamError:
+                logger.debug("Track ended")
                 break
-            self._audio_sample_rate = frame.sample_rate
-            self._audio_channels = len(frame.layout.channels)
+            except Exception as e:
+                logger.warning("[Track] 오디오 디코드 오류, 프레임 스킵: %s", e)
+                continue
+            self._audio_sample_rate = sr = frame.sample_rate
+            self._audio_channels = ch = len(frame.layout.channels)
             if self._ptt_active:
-                elapsed = asyncio.get_event_loop().time() - self._ptt_recording_start
-                if elapsed >= PTT_MAX_RECORDING_DURATION:
+                if loop_time() >= self._ptt_deadline:
                     self.send_dc({"type": "PTT_TIMEOUT"})
                     self._stop_recording()
                     continue
-                raw = frame.to_ndarray().tobytes()
-                if self._audio_buffer_size + len(raw) <= MAX_AUDIO_BUFFER_BYTES:
-                    self._audio_frames.append(raw)
-                    self._audio_buffer_size += len(raw)
+                # ndarray 왕복(배열 생성 + tobytes 복사) 대신 plane 버퍼에서 바로 기록
+                plane = frame.planes[0]
+                n = plane.buffer_size
+                # webrtcvad는 8/16/32/48kHz 모노 10·20·30ms 프레임만 지원
+                # (판정 불가능한 프레임은 발화로 간주)
+                is_silence = (
+                    ch == 1
+                    and sr in (8000, 16000, 32000, 48000)
+                    and n in (sr * 2 // 100, sr * 4 // 100, sr * 6 // 100)
+                    and not vad_is_speech(bytes(plane), sr)
+                )
+                pos = self._audio_pos
+                if pos + n <= max_bytes:
+                    # 무음 프레임도 버퍼에는 남김 — 녹화 오디오가 실시간 비디오
+                    # PTS와 어긋나지 않도록. STT 경로에서만 무음을 제외한다.
+                    buf[pos:pos + n] = plane
+                    self._audio_pos = pos + n
+                    if not is_silence:
+                        self._mark_speech(pos, pos + n)
+                    self._maybe_dispatch_stt_window(is_silence)
+
+    def _on_ice_gathering_state_change(self) -> None:
+        if self.peer and self.peer.iceGatheringState == "complete":
+            self._ice_gathered.set()
 
     def _on_connection_state_change(self) -> None:
         if self.peer is None:
             return
         state = self.peer.connectionState
         if state == "connected":
-            asyncio.ensure_future(self.stomp_ws.close())
+            self._loop.create_task(self.stomp_ws.close())
         elif state in ("failed", "closed"):
             from signaling.session import remove_session
             remove_session(self.room_id)
@@ -102,10 +191,11 @@ class WebRTCSession(DataChannelMixin, PTTMixin, InterviewMixin):
         answer = await self.peer.createAnswer()
         await self.peer.setLocalDescription(answer)
 
-        for _ in range(200):
-            if self.peer.iceGatheringState == "complete":
-                break
-            await asyncio.sleep(0.05)
+        if self.peer.iceGatheringState != "complete":
+            try:
+                await asyncio.wait_for(self._ice_gathered.wait(), timeout=10.0)
+            except asyncio.TimeoutError:
+                logger.warning("[ICE] 10초 내 수집 미완료, 현재까지의 후보로 응답 전송")
 
         await stomp.send(self.stomp_ws, "/app/signal/webrtc/answer", {
             "type": "WEBRTC_ANSWER",
@@ -123,17 +213,21 @@ class WebRTCSession(DataChannelMixin, PTTMixin, InterviewMixin):
         await self.peer.addIceCandidate(candidate)
 
     async def cleanup(self) -> None:
+        for task in self._track_tasks:
+            task.cancel()
+        self._track_tasks.clear()
         if self._interview_timer:
             self._interview_timer.cancel()
         if self._ptt_timeout_timer:
             self._ptt_timeout_timer.cancel()
 
         self._ptt_active = False
-        self._audio_frames.clear()
+        self._audio_pos = 0
         self._interview = None
 
         if self._recorder:
-            s3_url = self._recorder.stop()
+            # 인코더 flush + 멀티파트 완료는 초 단위로 걸릴 수 있어 루프 밖에서 수행
+            s3_url = await self._loop.run_in_executor(None, self._recorder.stop)
             if s3_url:
                 await self._save_material(s3_url)
             self._recorder = None
@@ -147,7 +241,13 @@ class WebRTCSession(DataChannelMixin, PTTMixin, InterviewMixin):
             self._dc = None
 
         if self.peer:
-            await self.peer.close()
+            # 바운드 메서드 리스너가 만드는 peer↔session 순환 참조를 끊음
+            self.peer.remove_all_listeners()
+            # 취소돼도 close 자체는 계속 진행되도록 shield, 단 무한 대기는 금지
+            try:
+                await asyncio.wait_for(asyncio.shield(self.peer.close()), timeout=2.0)
+            except asyncio.TimeoutError:
+                logger.warning("[Cleanup] peer.close() 2초 초과, 백그라운드로 계속 진행")
             self.peer = None
 
         self.closed.set()
@@ -172,7 +272,10 @@ class WebRTCSession(DataChannelMixin, PTTMixin, InterviewMixin):
 
 
 def _parse_candidate(candidate_str: str) -> RTCIceCandidate:
-    parts = candidate_str.replace("candidate:", "").split()
+    # foundation component protocol priority ip port "typ" type [name value ...]
+    parts = candidate_str.removeprefix("candidate:").split()
+    if len(parts) < 8 or parts[6] != "typ":
+        raise ValueError(f"malformed ICE candidate: {candidate_str!r}")
     candidate = RTCIceCandidate(
         component=int(parts[1]),
         foundation=parts[0],
@@ -182,8 +285,15 @@ def _parse_candidate(candidate_str: str) -> RTCIceCandidate:
         protocol=parts[2],
         type=parts[7],
     )
-    if "raddr" in parts:
-        candidate.relatedAddress = parts[parts.index("raddr") + 1]
-    if "rport" in parts:
-        candidate.relatedPort = int(parts[parts.index("rport") + 1])
+    # "typ" 뒤는 전부 name/value 쌍 → 한 번에 dict로 만들어 O(1) 조회
+    extras = dict(zip(parts[8::2], parts[9::2]))
+    raddr = extras.get("raddr")
+    if raddr:
+        candidate.relatedAddress = raddr
+    rport = extras.get("rport")
+    if rport:
+        candidate.relatedPort = int(rport)
+    tcptype = extras.get("tcptype")
+    if tcptype:
+        candidate.tcpType = tcptype
     return candidate
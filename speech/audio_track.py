@@ -1,6 +1,5 @@
 import asyncio
 import fractions
-import time
 from av import AudioFrame
 from aiortc.mediastreams import MediaStreamTrack
 
@@ -15,35 +14,49 @@ class TTSAudioTrack(MediaStreamTrack):
 
     def __init__(self) -> None:
         super().__init__()
-        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._queue: asyncio.Queue[bytes | memoryview | None] = asyncio.Queue()
         self._start_time: float | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._frame_count = 0
         self._done_event: asyncio.Event | None = None
+        # AudioFrame을 매 recv마다 새로 만들지 않고 2개를 돌려씀
+        # (직전 프레임은 인코더가 소비 중일 수 있으므로 풀 크기 2)
+        self._frame_pool = [self._make_frame(), self._make_frame()]
+
+    @staticmethod
+    def _make_frame() -> AudioFrame:
+        frame = AudioFrame(format="s16", layout="mono", samples=SAMPLES_PER_FRAME)
+        frame.sample_rate = SAMPLE_RATE
+        frame.time_base = fractions.Fraction(1, SAMPLE_RATE)
+        return frame
 
     async def recv(self) -> AudioFrame:
+        # 벽시계(time.time) 대신 이벤트 루프의 단조 시계로 페이싱 (NTP 점프 무관)
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        loop = self._loop
         if self._start_time is None:
-            self._start_time = time.time()
+            self._start_time = loop.time()
 
         target_time = self._start_time + self._frame_count * FRAME_DURATION
-        wait = target_time - time.time()
-        if wait > 0:
+        wait = target_time - loop.time()
+        if wait > 0.0005:
             await asyncio.sleep(wait)
 
         pcm_data = self._dequeue_frame()
 
-        frame = AudioFrame(format="s16", layout="mono", samples=SAMPLES_PER_FRAME)
-        frame.sample_rate = SAMPLE_RATE
+        frame = self._frame_pool[self._frame_count % 2]
         frame.pts = self._frame_count * SAMPLES_PER_FRAME
-        frame.time_base = fractions.Fraction(1, SAMPLE_RATE)
         frame.planes[0].update(pcm_data)
 
         self._frame_count += 1
         return frame
 
-    def _dequeue_frame(self) -> bytes:
-        if self._queue.empty():
+    def _dequeue_frame(self) -> bytes | memoryview:
+        try:
+            data = self._queue.get_nowait()
+        except asyncio.QueueEmpty:
             return SILENCE
-        data = self._queue.get_nowait()
         if data is None:
             if self._done_event:
                 self._done_event.set()
@@ -53,12 +66,16 @@ class TTSAudioTrack(MediaStreamTrack):
     async def play(self, pcm_bytes: bytes) -> None:
         self._done_event = asyncio.Event()
 
+        # memoryview 슬라이스는 복사가 없음 — 큐의 슬라이스가 원본을 붙잡고 있어
+        # 재생이 끝날 때까지 버퍼 수명도 보장됨. 복사는 마지막 패딩 청크 한 번뿐.
         frame_bytes = SAMPLES_PER_FRAME * 2
-        for i in range(0, len(pcm_bytes), frame_bytes):
-            chunk = pcm_bytes[i : i + frame_bytes]
-            if len(chunk) < frame_bytes:
-                chunk += b"\x00" * (frame_bytes - len(chunk))
-            self._queue.put_nowait(chunk)
+        mv = memoryview(pcm_bytes)
+        full_end = len(mv) // frame_bytes * frame_bytes
+        for i in range(0, full_end, frame_bytes):
+            self._queue.put_nowait(mv[i : i + frame_bytes])
+        if full_end < len(mv):
+            tail = bytes(mv[full_end:])
+            self._queue.put_nowait(tail + b"\x00" * (frame_bytes - len(tail)))
 
         self._queue.put_nowait(None)
         await self._done_event.wait()
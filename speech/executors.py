@@ -0,0 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
+# 블로킹 외부 API 호출 전용 스레드풀.
+# 기본 executor를 공유하면 TTS·STT 호출이 서로(그리고 다른 블로킹 작업)의
+# 워커를 점유해 head-of-line blocking이 생기므로 워크로드별로 분리한다.
+# 크기는 MAX_CONCURRENT_SESSIONS(10)에 맞춤.
+TTS_EXECUTOR = ThreadPoolExecutor(max_workers=10, thread_name_prefix="tts")
+STT_EXECUTOR = ThreadPoolExecutor(max_workers=10, thread_name_prefix="stt")
@@ -2,6 +2,7 @@ import av
 import io
 import fractions
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from av import AudioFrame, VideoFrame
 from storage.s3 import S3MultipartUpload, S3_INTERVIEW_PREFIX
 
@@ -22,8 +23,13 @@ class InterviewRecorder:
         self._v_stream = None
         self._a_stream = None
         self._running = False
+        self._closed = False  # _stop_sync가 컨테이너를 닫은 뒤 True (워커 스레드에서만 기록)
         self._audio_pts = 0
         self._video_pts = 0
+        # 인코딩/mux는 CPU 작업(PyAV는 GIL 해제)이라 시그널링 루프에서 돌리면
+        # 전 세션의 오디오 페이싱이 멈춤 → 녹화기마다 전용 워커 1개로 직렬화.
+        # 세션끼리는 각자의 워커에서 병렬로 인코딩됨.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"recorder-{room_id}")
 
     # 고정 녹화 해상도 (프레임은 이 크기로 스케일링됨)
     VIDEO_WIDTH = 1280
@@ -54,8 +60,17 @@ class InterviewRecorder:
         logger.info("[Recorder] 녹화 시작: %s", self._key)
 
     def push_video(self, frame: VideoFrame) -> None:
+        """이벤트 루프에서 호출 가능: 인코딩은 전용 워커에 넘기고 즉시 반환."""
         if not self._running:
             return
+        self._executor.submit(self._push_video_sync, frame)
+
+    def _push_video_sync(self, frame: VideoFrame) -> None:
+        # _running 재확인 금지: stop()이 _running을 먼저 내리고 _stop_sync를
+        # 큐에 넣으므로, 재확인하면 대기 중이던 꼬리 프레임이 전부 버려짐.
+        # 닫힌 컨테이너 보호는 _closed로만 한다 (같은 워커에서 순서 보장됨).
+        if self._closed:
+            return
         try:
             frame = frame.reformat(
                 width=self.VIDEO_WIDTH,
@@ -81,9 +96,15 @@ class InterviewRecorder:
     def push_audio_pcm(self, pcm_bytes: bytes, sample_rate: int = SAMPLE_RATE) -> None:
         """TTS PCM bytes 또는 마이크 raw PCM bytes 입력.
         sample_rate가 SAMPLE_RATE(48000)와 다를 경우 av.AudioResampler로 리샘플링.
+        이벤트 루프에서 호출 가능: 인코딩은 전용 워커에 넘기고 즉시 반환.
         """
         if not self._running:
             return
+        self._executor.submit(self._push_audio_sync, pcm_bytes, sample_rate)
+
+    def _push_audio_sync(self, pcm_bytes: bytes, sample_rate: int) -> None:
+        if self._closed:
+            return
         # 샘플레이트가 다른 경우 48000Hz로 리샘플링
         if sample_rate != SAMPLE_RATE:
             try:
@@ -114,9 +135,12 @@ class InterviewRecorder:
             frame.time_base = fractions.Fraction(1, SAMPLE_RATE)
             frame.planes[0].update(chunk)
             self._audio_pts += SAMPLES_PER_FRAME
-            for packet in self._a_stream.encode(frame):
-                self._container.mux(packet)
-                self._flush_to_s3()
+            try:
+                for packet in self._a_stream.encode(frame):
+                    self._container.mux(packet)
+                    self._flush_to_s3()
+            except Exception as e:
+                logger.warning("[Recorder] 오디오 인코딩/mux 실패 (스킵): %s", e)
 
     def _flush_to_s3(self) -> None:
         # BytesIO를 truncate하지 않고 새로 쓰인 부분만 S3로 전송
@@ -129,10 +153,17 @@ class InterviewRecorder:
             self._buf_flushed = end
 
     def stop(self) -> str | None:
-        """녹화 종료. 완성된 S3 URL 반환."""
+        """녹화 종료. 완성된 S3 URL 반환. (블로킹 — 호출부가 executor에서 실행)"""
         if not self._running:
             return None
         self._running = False
+        # 같은 워커 큐 뒤에 넣어 대기 중인 push들이 모두 인코딩된 뒤 마무리
+        url = self._executor.submit(self._stop_sync).result()
+        self._executor.shutdown(wait=False)
+        return url
+
+    def _stop_sync(self) -> str | None:
+        self._closed = True
         try:
             for packet in self._v_stream.encode():
                 self._container.mux(packet)
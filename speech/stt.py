@@ -4,7 +4,10 @@ from functools import partial
 from openai import OpenAI
 from django.conf import settings
 
+from speech.executors import STT_EXECUTOR
+
 _client: OpenAI | None = None
+_local_model = None
 
 
 def _get_client() -> OpenAI:
@@ -14,18 +17,64 @@ def _get_client() -> OpenAI:
     return _client
 
 
+def _get_local_model():
+    # faster-whisper(CTranslate2)는 로컬 백엔드를 켠 배포에만 설치됨 → 지연 임포트
+    global _local_model
+    if _local_model is None:
+        from faster_whisper import WhisperModel
+        # int8 양자화: FP16 대비 ~2배 처리량, 한국어 WER 차이는 측정 오차 수준
+        _local_model = WhisperModel(
+            settings.STT_LOCAL_MODEL,
+            device=settings.STT_LOCAL_DEVICE,
+            compute_type="int8",
+        )
+    return _local_model
+
+
+def _wav_to_float32_16k(wav_bytes: bytes):
+    """44바이트 RIFF 헤더의 PCM을 ffmpeg 디코드 없이 float32 16kHz 모노로 변환.
+
+    faster-whisper는 ndarray 입력 시 16kHz 모노 float32를 기대한다.
+    비정수배 샘플레이트 등 직접 변환이 안 되는 포맷이면 None을 반환해
+    호출부가 WAV 디코드 경로로 폴백하게 한다.
+    """
+    import numpy as np
+    channels = int.from_bytes(wav_bytes[22:24], "little")
+    sample_rate = int.from_bytes(wav_bytes[24:28], "little")
+    if sample_rate % 16000 != 0:
+        return None
+    pcm = np.frombuffer(wav_bytes, dtype=np.int16, offset=44)
+    if channels > 1:
+        pcm = pcm[: len(pcm) // channels * channels].reshape(-1, channels).mean(axis=1)
+    audio = pcm.astype(np.float32) / 32768.0
+    step = sample_rate // 16000
+    if step > 1:
+        # 블록 평균으로 16kHz로 다운샘플 (평균이 간이 저역 필터 역할)
+        audio = audio[: len(audio) // step * step].reshape(-1, step).mean(axis=1)
+    return audio
+
+
+def _transcribe_local_sync(wav_bytes: bytes) -> str:
+    # WAV 재파싱/ffmpeg 왕복을 건너뛰고 이미 갖고 있는 PCM을 바로 전달
+    audio = _wav_to_float32_16k(wav_bytes)
+    if audio is None:
+        audio = io.BytesIO(wav_bytes)
+    segments, _info = _get_local_model().transcribe(audio, language="ko", beam_size=1)
+    return "".join(segment.text for segment in segments)
+
+
 def _transcribe_sync(wav_bytes: bytes) -> str:
-    buf = io.BytesIO(wav_bytes)
-    buf.name = "audio.wav"
+    if settings.STT_BACKEND == "local":
+        return _transcribe_local_sync(wav_bytes)
+    # (파일명, bytes, content-type) 튜플이면 BytesIO 복사 없이 바로 멀티파트 인코딩됨
     response = _get_client().audio.transcriptions.create(
         model="whisper-1",
-        file=buf,
+        file=("audio.wav", wav_bytes, "audio/wav"),
         language="ko",
     )
-    buf.close()
     return response.text
 
 
 async def transcribe(wav_bytes: bytes) -> str:
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, partial(_transcribe_sync, wav_bytes))
+    return await loop.run_in_executor(STT_EXECUTOR, partial(_transcribe_sync, wav_bytes))
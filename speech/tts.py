@@ -5,11 +5,20 @@ import base64
 import logging
 import asyncio
 import urllib.request
+from collections import OrderedDict
 from functools import partial
 from django.conf import settings
 
+from speech.executors import TTS_EXECUTOR
+
 logger = logging.getLogger(__name__)
 
+# 짧은 고정 멘트(인사말·안내문 등)의 PCM 캐시.
+# PCM이 커서(1초당 ~96KB) 긴 문장까지 캐시하면 메모리가 부풀므로 짧은 것만.
+_PCM_CACHE: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+_PCM_CACHE_MAX = 32
+_CACHEABLE_TEXT_LEN = 60
+
 # ── 음성 설정 ─────────────────────────────────────────
 
 VOICE_CONFIGS = {
@@ -65,13 +74,25 @@ def _synthesize_sync(text: str, gender: str = "male") -> bytes:
         pcm_bytes = wf.readframes(wf.getnframes())
     buf.close()
 
-    logger.info(f"[TTS] 변환 완료: {len(text)}자 → {len(pcm_bytes)} bytes PCM")
+    logger.info("[TTS] 변환 완료: %d자 → %d bytes PCM", len(text), len(pcm_bytes))
     return pcm_bytes
 
 
 async def synthesize(text: str, gender: str = "male") -> bytes:
-    """비동기 TTS 호출"""
+    """비동기 TTS 호출 (짧은 고정 멘트는 PCM 캐시에서 바로 반환)"""
+    key = (text, gender)
+    pcm_bytes = _PCM_CACHE.get(key)
+    if pcm_bytes is not None:
+        _PCM_CACHE.move_to_end(key)
+        return pcm_bytes
+
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None, partial(_synthesize_sync, text, gender)
+    pcm_bytes = await loop.run_in_executor(
+        TTS_EXECUTOR, partial(_synthesize_sync, text, gender)
     )
+
+    if len(text) <= _CACHEABLE_TEXT_LEN:
+        _PCM_CACHE[key] = pcm_bytes
+        if len(_PCM_CACHE) > _PCM_CACHE_MAX:
+            _PCM_CACHE.popitem(last=False)
+    return pcm_bytes
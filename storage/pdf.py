@@ -1,10 +1,11 @@
 import io
 import logging
 
-import boto3
 import fitz  # pymupdf
 from django.conf import settings
 
+from storage.s3 import get_s3_client
+
 logger = logging.getLogger(__name__)
 
 MAX_RESUME_CHARS = 8000  # LLM 컨텍스트 과부하 방지
@@ -21,12 +22,7 @@ def extract_text_from_s3(s3_uri: str) -> str:
             logger.warning("[PDF] S3 URI에서 키 추출 실패: %s", s3_uri)
             return ""
 
-        s3 = boto3.client(
-            "s3",
-            region_name=settings.AWS_S3_REGION_NAME,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+        s3 = get_s3_client()
 
         buf = io.BytesIO()
         s3.download_fileobj(settings.AWS_STORAGE_BUCKET_NAME, key, buf)
@@ -1,23 +1,41 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
 import boto3
+from botocore.config import Config
 from django.conf import settings
 
 S3_INTERVIEW_PREFIX = "interviews"
 
+# 파트 업로드는 WAN 왕복이 길어 호출 스레드(이벤트 루프 포함)를 막지 않도록
+# 전용 풀에서 돌림. 파트끼리는 순서 무관하게 병렬 업로드 가능.
+_PART_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="s3-part")
+
+
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """공유 S3 클라이언트. 생성 시 TLS/자격 증명 설정 비용이 커서 재사용한다.
+
+    botocore 클라이언트는 스레드 세이프하므로 업로드/다운로드 전역에서 공유 가능.
+    """
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_S3_REGION_NAME,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        config=Config(max_pool_connections=32, tcp_keepalive=True),
+    )
+
 
 class S3MultipartUpload:
     MIN_PART_SIZE = 5 * 1024 * 1024  # 5MB (S3 최소 파트 크기)
 
     def __init__(self, key: str):
-        self._s3 = boto3.client(
-            "s3",
-            region_name=settings.AWS_S3_REGION_NAME,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+        self._s3 = get_s3_client()
         self._bucket = settings.AWS_STORAGE_BUCKET_NAME
         self._key = key
         self._upload_id: str | None = None
-        self._parts: list[dict] = []
+        self._part_futures: list[Future] = []
         self._part_number = 1
         self._buf = b""
 
@@ -34,29 +52,40 @@ class S3MultipartUpload:
             self._buf = self._buf[self.MIN_PART_SIZE :]
 
     def _flush_part(self, data: bytes) -> None:
+        part_number = self._part_number
+        self._part_number += 1
+        self._part_futures.append(
+            _PART_EXECUTOR.submit(self._upload_part, part_number, data)
+        )
+
+    def _upload_part(self, part_number: int, data: bytes) -> dict:
         resp = self._s3.upload_part(
             Bucket=self._bucket,
             Key=self._key,
             UploadId=self._upload_id,
-            PartNumber=self._part_number,
+            PartNumber=part_number,
             Body=data,
         )
-        self._parts.append({"PartNumber": self._part_number, "ETag": resp["ETag"]})
-        self._part_number += 1
+        return {"PartNumber": part_number, "ETag": resp["ETag"]}
 
     def complete(self) -> str:
         """남은 버퍼 업로드 후 완료. S3 URL 반환."""
         if self._buf:
             self._flush_part(self._buf)
             self._buf = b""
-        if not self._parts:
+        if not self._part_futures:
             self.abort()
             raise RuntimeError("S3MultipartUpload: 업로드할 데이터가 없습니다 (parts=0)")
+        # 진행 중인 파트 업로드를 모두 기다림 (실패 시 여기서 예외 전파 → abort)
+        parts = sorted(
+            (f.result() for f in self._part_futures),
+            key=lambda p: p["PartNumber"],
+        )
         self._s3.complete_multipart_upload(
             Bucket=self._bucket,
             Key=self._key,
             UploadId=self._upload_id,
-            MultipartUpload={"Parts": self._parts},
+            MultipartUpload={"Parts": parts},
         )
         return f"https://{self._bucket}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{self._key}"
 